@@ -1,6 +1,8 @@
 import streamlit as st
-from itertools import product
-import math
+from itertools import islice
+from planner import calculate_gpa, calculate_cgpa, total_points, gpa_from_points, diverse_plans
+
+MAX_MODIFIABLE_SUBJECTS = 16
 
 # =====================================================================
 # PAGE CONFIGURATION
@@ -237,18 +239,12 @@ def reset_app():
     st.session_state.gpas_sem1 = {}
     st.session_state.gpas_sem2 = {}
 
-def calculate_gpa(gpa_dict, credit_dict):
-    if not credit_dict: return 0.0
-    total_credits = sum(credit_dict.values())
-    total_points = sum(gpa_dict.get(sub, 0) * cred for sub, cred in credit_dict.items())
-    return round(total_points / total_credits, 2) if total_credits > 0 else 0.0
-
-def calculate_cgpa(gpas_1, creds_1, gpas_2, creds_2):
-    total_credits = sum(creds_1.values()) + sum(creds_2.values())
-    if total_credits == 0: return 0.0
-    total_points = sum(gpas_1.get(sub, 0) * cred for sub, cred in creds_1.items()) + \
-                   sum(gpas_2.get(sub, 0) * cred for sub, cred in creds_2.items())
-    return round(total_points / total_credits, 2)
+def take_plans(n):
+    # Pulls one plan past the page so the "show more" control only appears when one exists
+    new = st.session_state.plan_lookahead + list(islice(st.session_state.plan_iter, n + 1 - len(st.session_state.plan_lookahead)))
+    st.session_state.plans_shown += new[:n]
+    st.session_state.plan_lookahead = new[n:]
+    st.session_state.plans_more = bool(new[n:])
 
 def my_rerun():
     if hasattr(st, "rerun"): st.rerun()
@@ -423,6 +419,13 @@ with main_container:
                     default=st.session_state.get("locked_sem1", [])
                 )
 
+        spacer(1)
+        st.markdown("##### Option Diversity")
+        st.session_state.min_diff = st.slider(
+            "Minimum number of improved subjects that must differ between recommended options:",
+            0, 3, st.session_state.get("min_diff", 1)
+        )
+
         spacer(3)
         c1, c2, c3 = st.columns([1, 2, 1])
         with c1:
@@ -452,87 +455,88 @@ with main_container:
             base_sgpa2 = 0.0
             base_cgpa = base_sgpa1
             
+        target_cgpa = st.session_state.target_type == "Target CGPA"
         modifiable = []
-        ranges = []
-        subject_credits = {}
+        options = []
         
         if sem == 2:
             for sub in st.session_state.improving_subjects:
                 modifiable.append((1, sub))
-                ranges.append(range(base_gpas1[sub], 11))
-                subject_credits[(1, sub)] = creds1[sub]
+                options.append((10 - base_gpas1[sub], creds1[sub], target_cgpa))
             for sub in creds2:
                 if sub not in st.session_state.get("locked_sem2", []):
                     modifiable.append((2, sub))
-                    ranges.append(range(base_gpas2[sub], 11))
-                    subject_credits[(2, sub)] = creds2[sub]
+                    options.append((10 - base_gpas2[sub], creds2[sub], True))
         else:
             for sub in creds1:
                 if sub not in st.session_state.get("locked_sem1", []):
                     modifiable.append((1, sub))
-                    ranges.append(range(base_gpas1[sub], 11))
-                    subject_credits[(1, sub)] = creds1[sub]
+                    options.append((10 - base_gpas1[sub], creds1[sub], True))
                     
-        total_combinations = math.prod(len(r) for r in ranges) if ranges else 0
+        def build_plan(inc):
+            temp_gpas1 = base_gpas1.copy()
+            temp_gpas2 = base_gpas2.copy()
+            for d, (s_sem, sub) in zip(inc, modifiable):
+                if s_sem == 1:
+                    temp_gpas1[sub] += d
+                else:
+                    temp_gpas2[sub] += d
+            if sem == 2:
+                new_sgpa = calculate_gpa(temp_gpas2, creds2)
+                new_cgpa = calculate_cgpa(temp_gpas1, creds1, temp_gpas2, creds2)
+            else:
+                new_sgpa = calculate_gpa(temp_gpas1, creds1)
+                new_cgpa = new_sgpa
+            return {
+                "effort": sum(d * cred for d, (_, cred, _) in zip(inc, options)),
+                "gpas1": temp_gpas1,
+                "gpas2": temp_gpas2,
+                "cgpa": new_cgpa,
+                "sgpa": new_sgpa
+            }
         
-        if total_combinations > 5000000:
-            st.error(f"Too many optimization variables ({total_combinations:,} paths). Please lock a few subjects to proceed.")
+        if len(modifiable) > MAX_MODIFIABLE_SUBJECTS:
+            st.error(f"Too many optimization variables ({len(modifiable)} subjects). Please lock a few subjects to proceed.")
             if st.button("← Adjust Strategy"):
                 prev_step()
                 my_rerun()
             st.stop()
             
-        results = []
-        max_cgpa_achieved = 0.0
-        max_sgpa_achieved = 0.0
+        def meets_target(plan):
+            return (plan["cgpa"] if target_cgpa else plan["sgpa"]) >= st.session_state.target_val
         
-        if modifiable:
-            with st.spinner("Analyzing academic permutations..."):
-                for combo in product(*ranges):
-                    temp_gpas1 = base_gpas1.copy()
-                    temp_gpas2 = base_gpas2.copy()
-                    
-                    for i, (s_sem, sub) in enumerate(modifiable):
-                        if s_sem == 1:
-                            temp_gpas1[sub] = combo[i]
-                        else:
-                            temp_gpas2[sub] = combo[i]
-                    
-                    if sem == 2:
-                        new_sgpa2 = calculate_gpa(temp_gpas2, creds2)
-                        new_cgpa = calculate_cgpa(temp_gpas1, creds1, temp_gpas2, creds2)
-                        max_cgpa_achieved = max(max_cgpa_achieved, new_cgpa)
-                        max_sgpa_achieved = max(max_sgpa_achieved, new_sgpa2)
-                        
-                        valid = (new_cgpa >= st.session_state.target_val) if st.session_state.target_type == "Target CGPA" else (new_sgpa2 >= st.session_state.target_val)
-                    else:
-                        new_sgpa1 = calculate_gpa(temp_gpas1, creds1)
-                        new_cgpa = new_sgpa1
-                        max_cgpa_achieved = max(max_cgpa_achieved, new_cgpa)
-                        max_sgpa_achieved = max(max_sgpa_achieved, new_sgpa1)
-                        
-                        valid = (new_cgpa >= st.session_state.target_val) if st.session_state.target_type == "Target CGPA" else (new_sgpa1 >= st.session_state.target_val)
-                            
-                    if valid:
-                        effort = sum((combo[i] - (base_gpas1[sub] if s_sem == 1 else base_gpas2[sub])) * subject_credits[(s_sem, sub)] for i, (s_sem, sub) in enumerate(modifiable))
-                        results.append({
-                            "effort": effort,
-                            "gpas1": temp_gpas1,
-                            "gpas2": temp_gpas2,
-                            "cgpa": new_cgpa,
-                            "sgpa": new_sgpa2 if sem == 2 else new_sgpa1
-                        })
+        # The target metric only moves with the grade points gained in the subjects it counts,
+        # so the search reduces to reaching the smallest sufficient points gain.
+        if sem == 2 and target_cgpa:
+            target_points = total_points(base_gpas1, creds1) + total_points(base_gpas2, creds2)
+            target_credits = sum(creds1.values()) + sum(creds2.values())
         else:
-            res_cgpa = base_cgpa
-            res_sgpa = base_sgpa2 if sem == 2 else base_sgpa1
-            max_cgpa_achieved = res_cgpa
-            max_sgpa_achieved = res_sgpa
-            
-            valid = (res_cgpa >= st.session_state.target_val) if st.session_state.target_type == "Target CGPA" else (res_sgpa >= st.session_state.target_val)
-            if valid:
-                results.append({
-                    "effort": 0, "gpas1": base_gpas1, "gpas2": base_gpas2, "cgpa": res_cgpa, "sgpa": res_sgpa
-                })
+            target_points = total_points(base_gpas2, creds2) if sem == 2 else total_points(base_gpas1, creds1)
+            target_credits = sum((creds2 if sem == 2 else creds1).values())
+        max_gain = sum(steps * cred for steps, cred, counts in options if counts)
+        required_gain = next(
+            (p for p in range(max_gain + 1) if gpa_from_points(target_points + p, target_credits) >= st.session_state.target_val),
+            max_gain + 1
+        )
+        
+        best_possible = build_plan([steps for steps, _, _ in options])
+        max_cgpa_achieved = best_possible["cgpa"]
+        max_sgpa_achieved = best_possible["sgpa"]
+        
+        min_diff = st.session_state.get("min_diff", 1)
+        plan_key = (
+            sem, st.session_state.target_type, st.session_state.target_val, min_diff, tuple(modifiable),
+            tuple(creds1.items()), tuple(creds2.items()), tuple(base_gpas1.items()), tuple(base_gpas2.items())
+        )
+        if st.session_state.get("plan_key") != plan_key:
+            st.session_state.plan_key = plan_key
+            plans = (build_plan(inc) for inc in diverse_plans(options, required_gain, min_diff))
+            st.session_state.plan_iter = (plan for plan in plans if meets_target(plan))
+            st.session_state.plan_lookahead = []
+            st.session_state.plans_shown = []
+            with st.spinner("Analyzing academic permutations..."):
+                take_plans(3)
+        results = st.session_state.plans_shown
 
         # --- Dashboard Top Metrics ---
         st.markdown("### Top Summary")
@@ -546,7 +550,6 @@ with main_container:
             """, unsafe_allow_html=True)
             
         if results:
-            results.sort(key=lambda x: x["effort"])
             best = results[0]
             gain = round(best['cgpa'] - base_cgpa, 2)
             gain_html = f"<div class='gain-positive'>Gain: +{gain}</div>" if gain > 0 else (f"<div class='gain-negative'>Gain: {gain}</div>" if gain < 0 else "<div>Gain: 0.0</div>")
@@ -570,7 +573,7 @@ with main_container:
             spacer(2)
             st.markdown("### Recommended Strategies")
             
-            for idx, res in enumerate(results[:3]):
+            for idx, res in enumerate(results):
                 opt_gain = round(res['cgpa'] - base_cgpa, 2)
                 opt_gain_str = f"+{opt_gain}" if opt_gain > 0 else str(opt_gain)
                 gain_color = "#48bb78" if opt_gain > 0 else "#a0aec0"
@@ -627,7 +630,17 @@ with main_container:
                     
                 html += "</div></div>"
                 st.markdown(html, unsafe_allow_html=True)
-                
+
+            if st.session_state.plans_more:
+                _, more_col, _ = st.columns([1, 1, 1])
+                with more_col:
+                    if st.button("Show More Options", use_container_width=True):
+                        with st.spinner("Finding more strategies..."):
+                            take_plans(3)
+                        my_rerun()
+            elif len(results) > 3:
+                st.caption("All matching strategies are shown.")
+
         else:
             with c2:
                 st.markdown(f"""
@@ -0,0 +1,120 @@
+import heapq
+
+# =====================================================================
+# GPA ARITHMETIC
+# =====================================================================
+def total_points(gpa_dict, credit_dict):
+    return sum(gpa_dict.get(sub, 0) * cred for sub, cred in credit_dict.items())
+
+def gpa_from_points(points, credits):
+    return round(points / credits, 2) if credits > 0 else 0.0
+
+def calculate_gpa(gpa_dict, credit_dict):
+    if not credit_dict: return 0.0
+    return gpa_from_points(total_points(gpa_dict, credit_dict), sum(credit_dict.values()))
+
+def calculate_cgpa(gpas_1, creds_1, gpas_2, creds_2):
+    return gpa_from_points(total_points(gpas_1, creds_1) + total_points(gpas_2, creds_2),
+                           sum(creds_1.values()) + sum(creds_2.values()))
+
+# =====================================================================
+# PLAN SEARCH
+# =====================================================================
+# options: (max_increment, credits, counts_toward_target) per modifiable subject.
+# A plan is a tuple of grade increments, one per option. Its effort is the credit-weighted
+# sum of increments and its target gain the same sum over the subjects that count.
+
+def enumerate_plans(options, required_gain):
+    # Lazily yields every plan whose target gain reaches required_gain, in nondecreasing
+    # effort order. Every branch explored completes to a valid plan.
+    n = len(options)
+    # best[k][e] = max target gain from options[k:] spending exactly e effort points
+    best = [None] * (n + 1)
+    best[n] = {0: 0}
+    for k in range(n - 1, -1, -1):
+        steps, cred, counts = options[k]
+        table = {}
+        for e, g in best[k + 1].items():
+            for d in range(steps + 1):
+                ne, ng = e + d * cred, g + (d * cred if counts else 0)
+                if ng > table.get(ne, -1): table[ne] = ng
+        best[k] = table
+
+    def walk(k, effort_left, gain_left, prefix):
+        if k == n:
+            yield prefix
+            return
+        steps, cred, counts = options[k]
+        for d in range(steps + 1):
+            e = effort_left - d * cred
+            if e < 0: break
+            g = gain_left - (d * cred if counts else 0)
+            rest = best[k + 1].get(e)
+            if rest is not None and rest >= g:
+                yield from walk(k + 1, e, g, prefix + (d,))
+
+    for effort in sorted(best[0]):
+        if best[0][effort] >= required_gain:
+            yield from walk(0, effort, required_gain, ())
+
+def _split_gain(members, gain):
+    # members: (index, max_increment, credits) with every increment >= 1; returns {index: increment}
+    # summing to exactly gain. The caller guarantees the gain is reachable.
+    reach = [1]
+    for _, steps, cred in reversed(members):
+        reach.append(_shift_or(reach[-1], steps, cred))
+    reach.reverse()
+    split = {}
+    for k, (i, steps, cred) in enumerate(members):
+        for d in range(1, steps + 1):
+            if gain >= d * cred and reach[k + 1] >> (gain - d * cred) & 1:
+                split[i] = d
+                gain -= d * cred
+                break
+    return split
+
+def _shift_or(bits, steps, cred):
+    # Reachable gains once a subject is raised by 1..steps grades, as a bitmask over gains
+    out = 0
+    for d in range(1, steps + 1):
+        out |= bits << (d * cred)
+    return out
+
+def diverse_plans(options, required_gain, min_diff):
+    # Lazily yields the cheapest valid plan for each set of improved subjects, cheapest first,
+    # skipping sets that differ from an already yielded set in fewer than min_diff subjects.
+    # The search runs over the 2^n subject sets rather than every grade combination.
+    if min_diff <= 0:
+        yield from enumerate_plans(options, required_gain)
+        return
+    n = len(options)
+    need = max(required_gain, 0)
+    # reach[mask] = bitmask of target gains reachable with exactly the subjects in mask improved,
+    # extra[mask] = effort spent on subjects in mask that do not count toward the target
+    reach = [1] + [0] * ((1 << n) - 1)
+    extra = [0] * (1 << n)
+    heap = [(0, 0)] if need == 0 else []
+    for mask in range(1, 1 << n):
+        i = (mask & -mask).bit_length() - 1
+        prev = mask & (mask - 1)
+        steps, cred, counts = options[i]
+        if steps == 0: continue
+        if counts:
+            reach[mask] = _shift_or(reach[prev], steps, cred)
+            extra[mask] = extra[prev]
+        else:
+            reach[mask] = reach[prev]
+            extra[mask] = extra[prev] + cred
+        high = reach[mask] >> need
+        if high:
+            heap.append((extra[mask] + need + (high & -high).bit_length() - 1, mask))
+    heapq.heapify(heap)
+
+    kept = []
+    while heap:
+        effort, mask = heapq.heappop(heap)
+        if any(bin(mask ^ prev).count("1") < min_diff for prev in kept): continue
+        kept.append(mask)
+        members = [(i, options[i][0], options[i][1]) for i in range(n) if mask >> i & 1 and options[i][2]]
+        split = _split_gain(members, effort - extra[mask])
+        yield tuple(split.get(i, 1) if mask >> i & 1 else 0 for i in range(n))
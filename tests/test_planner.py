@@ -0,0 +1,81 @@
+import random
+from itertools import product
+
+import pytest
+
+from planner import calculate_cgpa, calculate_gpa, diverse_plans, enumerate_plans
+
+
+def effort(plan, options):
+    return sum(d * cred for d, (_, cred, _) in zip(plan, options))
+
+
+def gain(plan, options):
+    return sum(d * cred for d, (_, cred, counts) in zip(plan, options) if counts)
+
+
+def support(plan):
+    return frozenset(i for i, d in enumerate(plan) if d)
+
+
+def random_case(rng):
+    options = [(rng.randint(0, 4), rng.choice([2, 4]), rng.random() < 0.7) for _ in range(rng.randint(0, 5))]
+    return options, rng.randint(-2, 30)
+
+
+def brute_force(options, required_gain):
+    return [p for p in product(*[range(steps + 1) for steps, _, _ in options]) if gain(p, options) >= required_gain]
+
+
+def test_calculate_gpa():
+    assert calculate_gpa({"A": 8, "B": 6}, {"A": 4, "B": 2}) == 7.33
+    assert calculate_gpa({}, {}) == 0.0
+    assert calculate_gpa({"A": 8}, {"A": 0}) == 0.0
+
+
+def test_calculate_cgpa():
+    assert calculate_cgpa({"A": 8}, {"A": 4}, {"B": 6}, {"B": 4}) == 7.0
+    assert calculate_cgpa({}, {}, {}, {}) == 0.0
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_enumerate_plans_matches_brute_force(seed):
+    options, required_gain = random_case(random.Random(seed))
+    got = list(enumerate_plans(options, required_gain))
+    expected = brute_force(options, required_gain)
+    assert sorted(got) == sorted(expected)
+    efforts = [effort(p, options) for p in got]
+    assert efforts == sorted(efforts)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_diverse_plans_yields_cheapest_plan_per_subject_set(seed):
+    options, required_gain = random_case(random.Random(seed))
+    got = list(diverse_plans(options, required_gain, 1))
+    cheapest = {}
+    for p in brute_force(options, required_gain):
+        key = support(p)
+        cheapest[key] = min(cheapest.get(key, effort(p, options)), effort(p, options))
+    assert all(gain(p, options) >= required_gain for p in got)
+    assert {support(p): effort(p, options) for p in got} == cheapest
+    assert len(got) == len(cheapest)
+    efforts = [effort(p, options) for p in got]
+    assert efforts == sorted(efforts)
+
+
+@pytest.mark.parametrize("seed", range(50))
+@pytest.mark.parametrize("min_diff", [2, 3])
+def test_diverse_plans_respects_min_diff(seed, min_diff):
+    options, required_gain = random_case(random.Random(seed))
+    got = list(diverse_plans(options, required_gain, min_diff))
+    for i, a in enumerate(got):
+        assert gain(a, options) >= required_gain
+        for b in got[:i]:
+            assert len(support(a) ^ support(b)) >= min_diff
+    efforts = [effort(p, options) for p in got]
+    assert efforts == sorted(efforts)
+
+
+def test_diverse_plans_without_min_diff_is_full_enumeration():
+    options = [(3, 4, True), (2, 2, False), (4, 2, True)]
+    assert list(diverse_plans(options, 6, 0)) == list(enumerate_plans(options, 6))